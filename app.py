@@ -1,18 +1,18 @@
 # Import Libraries
 import os
-import re
 import logging
+import threading
 import streamlit as st
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file if it exists
 load_dotenv()
 
 # Import modules
-from modules.ocr_processor import OCRProcessor
-from modules.rag_processor import RAGProcessor
+from modules.clients import get_ocr_processor, get_rag_processor
+from modules.semantic_cache import SemanticCache
 from modules.session_manager import SessionManager
 
 # Configure logging
@@ -21,6 +21,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Map uploaded file extensions to the type they are processed as
+EXT_TO_TYPE = {
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".pdf": "pdf",
+    ".docx": "docx",
+}
+
+# Preview shown in the sidebar for each processing type
+TYPE_TO_PREVIEW = {
+    "image": lambda file: st.image(
+        file, caption=f"Uploaded: {file.name}", use_container_width=True
+    ),
+    "pdf": lambda file: st.info(f"Uploaded PDF: {file.name}"),
+    "docx": lambda file: st.info(f"Uploaded Word document: {file.name}"),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def start_ocr_warm_up() -> None:
+    """Warm up the OCR client's connection in the background, once per server."""
+    try:
+        ocr_processor = get_ocr_processor()
+    except ValueError as e:
+        # Missing API key; processing a document will report it to the user
+        logger.warning(f"Skipping OCR warm-up: {str(e)}")
+        return
+
+    threading.Thread(
+        target=ocr_processor.warm_up, name="ocr-warm-up", daemon=True
+    ).start()
+
 
 def setup_page_config() -> None:
     """Set up the Streamlit page configuration."""
@@ -51,25 +84,14 @@ def setup_sidebar() -> Optional[tuple]:
         # File uploader
         uploaded_file = st.file_uploader(
             "Choose a file",
-            type=["pdf", "png", "jpg", "jpeg", "docx"],
+            type=[ext.lstrip(".") for ext in EXT_TO_TYPE],
             help="Upload a PDF, image, or Word document to extract text and chat with it.",
         )
 
         if uploaded_file is not None:
-            file_type = None
-            if uploaded_file.name.lower().endswith((".png", ".jpg", ".jpeg")):
-                file_type = "image"
-                st.image(
-                    uploaded_file,
-                    caption=f"Uploaded: {uploaded_file.name}",
-                    use_container_width=True,
-                )
-            elif uploaded_file.name.lower().endswith(".pdf"):
-                file_type = "pdf"
-                st.info(f"Uploaded PDF: {uploaded_file.name}")
-            elif uploaded_file.name.lower().endswith(".docx"):
-                file_type = "docx"
-                st.info(f"Uploaded Word document: {uploaded_file.name}")
+            file_type = EXT_TO_TYPE.get(Path(uploaded_file.name).suffix.lower())
+            if file_type:
+                TYPE_TO_PREVIEW[file_type](uploaded_file)
 
             # Process button
             if st.button("🔍 Process Document", use_container_width=True):
@@ -79,8 +101,10 @@ def setup_sidebar() -> Optional[tuple]:
         st.divider()
         st.header("⚙️ Settings")
         
+        settings = SessionManager.get_user_settings()
+
         # Layout toggle
-        previous_layout = SessionManager.get_user_setting("layout", "side-by-side")
+        previous_layout = settings.get("layout", "side-by-side")
         layout_option = st.radio(
             "Layout",
             options=["Side-by-side", "Stacked"],
@@ -89,17 +113,17 @@ def setup_sidebar() -> Optional[tuple]:
         )
         new_layout = "side-by-side" if layout_option == "Side-by-side" else "stacked"
         
-        # Update layout setting and rerun if changed
+        # The main panel is drawn after the sidebar, so the new layout applies
+        # in this same run without a second st.rerun() pass
         if previous_layout != new_layout:
             SessionManager.update_user_setting("layout", new_layout)
-            st.rerun()
 
         # Temperature slider
         temperature = st.slider(
             "Temperature",
             min_value=0.0,
             max_value=1.0,
-            value=SessionManager.get_user_setting("temperature", 0.2),
+            value=settings.get("temperature", 0.2),
             step=0.1,
             help="Higher values make the output more random, lower values make it more deterministic.",
         )
@@ -110,7 +134,7 @@ def setup_sidebar() -> Optional[tuple]:
             "Max Tokens",
             min_value=256,
             max_value=4096,
-            value=SessionManager.get_user_setting("max_tokens", 2048),
+            value=settings.get("max_tokens", 2048),
             step=256,
             help="Maximum number of tokens to generate in the response.",
         )
@@ -141,26 +165,31 @@ def process_document(file, file_type) -> bool:
             # Process with OCR if it's an image or PDF
             status.update(label="Extracting text with OCR...")
             if file_type in ["image", "pdf"]:
-                ocr_processor = OCRProcessor()
+                ocr_processor = get_ocr_processor()
                 extracted_text = ocr_processor.extract_text(file, file_type)
                 SessionManager.store_ocr_results(extracted_text)
                 status.update(label="OCR processing complete!")
             elif file_type == "docx":
                 # For Word documents, use the RAG processor's extraction method
-                rag_processor = RAGProcessor()
+                rag_processor = get_rag_processor()
                 extracted_text = rag_processor.extract_text_from_docx(file)
                 SessionManager.store_ocr_results(extracted_text)
                 status.update(label="Text extraction complete!")
 
             # Initialize RAG with the extracted text
-            if SessionManager.get_ocr_results():
+            ocr_results = SessionManager.get_ocr_results()
+            if ocr_results:
                 status.update(label="Initializing RAG system...")
-                rag_processor = RAGProcessor()
-                rag_processor.process_document(text=SessionManager.get_ocr_results())
+                # Fork the shared processor so the document stays session-local
+                rag_processor = get_rag_processor().fork()
+                rag_processor.process_document(text=ocr_results)
                 SessionManager.set_rag_initialized(True)
 
                 # Store the RAG processor in session state for later use
                 st.session_state.rag_processor = rag_processor
+                st.session_state.query_cache = SemanticCache(
+                    rag_processor.embeddings.embed_query
+                )
                 status.update(label="Document processing complete!", state="complete")
                 return True
     except Exception as e:
@@ -170,178 +199,164 @@ def process_document(file, file_type) -> bool:
     return False
 
 
+def query_document(
+    question: str, chat_history: List[Tuple[str, str]]
+) -> Dict[str, Any]:
+    """
+    Answer a question about the processed document, reusing cached answers.
+
+    Args:
+        question: The user's question
+        chat_history: Previous interactions as (human_message, ai_message) tuples
+
+    Returns:
+        Response from the RAG system containing answer and source documents
+    """
+    query_cache = st.session_state.query_cache
+
+    # A repeated question in the same conversation state needs no API call at all
+    history_key = query_cache.history_key(chat_history)
+    response = query_cache.get_exact(question, history_key)
+    if response is not None:
+        return response
+
+    # Follow-ups depend on the conversation, so they go straight to the RAG
+    # chain; a near-duplicate standalone question is answered from the cache,
+    # skipping retrieval and generation, and only the query is embedded
+    if chat_history:
+        response = st.session_state.rag_processor.query(question, chat_history)
+    else:
+        vector = query_cache.embed(question)
+        response = query_cache.get(vector)
+        if response is None:
+            response = st.session_state.rag_processor.query(question, chat_history)
+            query_cache.set(vector, response)
+
+    query_cache.set_exact(question, history_key, response)
+    return response
+
+
+def render_history(history: List[Dict[str, Any]]) -> None:
+    """
+    Render the stored chat messages.
+
+    Args:
+        history: The chat history as a list of message dictionaries
+    """
+    for message in history:
+        with st.chat_message(message["role"]):
+            # Messages are always strings, so skip st.write's type dispatch
+            st.markdown(message["content"])
+
+
+def render_extracted_text(height: int) -> None:
+    """
+    Display the extracted text panel.
+
+    Args:
+        height: Height of the text area in pixels
+    """
+    ocr_results = SessionManager.get_ocr_results()
+
+    st.header("📝 Extracted Text")
+    if ocr_results:
+        st.text_area(
+            "OCR Results",
+            ocr_results,
+            height=height,
+            disabled=True,
+        )
+    else:
+        st.info("Upload and process a document to see extracted text.")
+
+
+@st.fragment
+def render_chat() -> None:
+    """
+    Display the chat panel and answer any new question.
+
+    Runs as a fragment, so sending a message reruns only this panel rather than
+    the sidebar and extracted-text panel as well.
+    """
+    st.header("💬 Chat with Document")
+
+    # Create a container for chat messages
+    chat_container = st.container()
+
+    # Create a container for the input box that will always be at the bottom
+    input_container = st.container()
+
+    # Handle input in the bottom container
+    with input_container:
+        user_input = st.chat_input("Ask a question about the document...")
+
+    # Display chat history in the chat container
+    with chat_container:
+        render_history(SessionManager.get_chat_history())
+
+        # Process new input if provided
+        if user_input:
+            # Add user message to chat history
+            SessionManager.add_message("user", user_input)
+
+            # Display user message
+            with st.chat_message("user"):
+                st.write(user_input)
+
+            # Generate and display assistant response
+            with st.chat_message("assistant"):
+                if SessionManager.is_rag_initialized() and hasattr(
+                    st.session_state, "rag_processor"
+                ):
+                    with st.spinner("Thinking..."):
+                        try:
+                            # Get response from RAG
+                            chat_history = SessionManager.get_chat_history_for_rag()
+                            response = query_document(user_input, chat_history)
+
+                            # Display response
+                            st.write(response["answer"])
+
+                            # Add assistant message to chat history
+                            SessionManager.add_message("assistant", response["answer"])
+
+                            # Display source documents in an expander
+                            if response["source_documents"]:
+                                with st.expander("Source Documents"):
+                                    for i, doc in enumerate(
+                                        response["source_documents"]
+                                    ):
+                                        st.markdown(f"**Source {i+1}:**")
+                                        st.text(doc.page_content)
+                                        st.divider()
+                        except Exception as e:
+                            logger.error(
+                                f"Error generating response: {str(e)}", exc_info=True
+                            )
+                            error_message = f"Error generating response: {str(e)}"
+                            st.error(error_message)
+                            SessionManager.add_message("assistant", error_message)
+                else:
+                    message = "Please upload and process a document first."
+                    st.warning(message)
+                    SessionManager.add_message("assistant", message)
+
+
 def display_chat_interface() -> None:
     """Display the chat interface."""
     # Get the current layout setting
     layout = SessionManager.get_user_setting("layout", "side-by-side")
-    
+
     if layout == "side-by-side":
-        # Side-by-side layout (original)
         col1, col2 = st.columns([2, 3])
-        
         with col1:
-            st.header("📝 Extracted Text")
-            if SessionManager.get_ocr_results():
-                st.text_area(
-                    "OCR Results",
-                    SessionManager.get_ocr_results(),
-                    height=500,
-                    disabled=True,
-                )
-            else:
-                st.info("Upload and process a document to see extracted text.")
-        
+            render_extracted_text(height=500)
         with col2:
-            st.header("💬 Chat with Document")
-            
-            # Create a container for chat messages
-            chat_container = st.container()
-            
-            # Create a container for the input box that will always be at the bottom
-            input_container = st.container()
-            
-            # Handle input in the bottom container
-            with input_container:
-                user_input = st.chat_input("Ask a question about the document...")
-            
-            # Display chat history in the chat container
-            with chat_container:
-                for message in SessionManager.get_chat_history():
-                    with st.chat_message(message["role"]):
-                        st.write(message["content"])
-                
-                # Process new input if provided
-                if user_input:
-                    # Add user message to chat history
-                    SessionManager.add_message("user", user_input)
-                    
-                    # Display user message
-                    with st.chat_message("user"):
-                        st.write(user_input)
-                    
-                    # Generate and display assistant response
-                    with st.chat_message("assistant"):
-                        if SessionManager.is_rag_initialized() and hasattr(
-                            st.session_state, "rag_processor"
-                        ):
-                            with st.spinner("Thinking..."):
-                                try:
-                                    # Get response from RAG
-                                    chat_history = SessionManager.get_chat_history_for_rag()
-                                    response = st.session_state.rag_processor.query(
-                                        user_input, chat_history
-                                    )
-                                    
-                                    # Display response
-                                    st.write(response["answer"])
-                                    
-                                    # Add assistant message to chat history
-                                    SessionManager.add_message("assistant", response["answer"])
-                                    
-                                    # Display source documents in an expander
-                                    if response["source_documents"]:
-                                        with st.expander("Source Documents"):
-                                            for i, doc in enumerate(
-                                                response["source_documents"]
-                                            ):
-                                                st.markdown(f"**Source {i+1}:**")
-                                                st.text(doc.page_content)
-                                                st.divider()
-                                except Exception as e:
-                                    logger.error(
-                                        f"Error generating response: {str(e)}", exc_info=True
-                                    )
-                                    error_message = f"Error generating response: {str(e)}"
-                                    st.error(error_message)
-                                    SessionManager.add_message("assistant", error_message)
-                        else:
-                            message = "Please upload and process a document first."
-                            st.warning(message)
-                            SessionManager.add_message("assistant", message)
+            render_chat()
     else:
-        # Stacked layout
-        # First section: Extracted Text
-        st.header("📝 Extracted Text")
-        if SessionManager.get_ocr_results():
-            st.text_area(
-                "OCR Results",
-                SessionManager.get_ocr_results(),
-                height=300,  # Reduced height for stacked layout
-                disabled=True,
-            )
-        else:
-            st.info("Upload and process a document to see extracted text.")
-        
-        # Add a divider between sections
+        render_extracted_text(height=300)  # Reduced height for stacked layout
         st.divider()
-        
-        # Second section: Chat with Document
-        st.header("💬 Chat with Document")
-        
-        # Create a container for chat messages
-        chat_container = st.container()
-        
-        # Create a container for the input box that will always be at the bottom
-        input_container = st.container()
-        
-        # Handle input in the bottom container
-        with input_container:
-            user_input = st.chat_input("Ask a question about the document...")
-        
-        # Display chat history in the chat container
-        with chat_container:
-            for message in SessionManager.get_chat_history():
-                with st.chat_message(message["role"]):
-                    st.write(message["content"])
-            
-            # Process new input if provided
-            if user_input:
-                # Add user message to chat history
-                SessionManager.add_message("user", user_input)
-                
-                # Display user message
-                with st.chat_message("user"):
-                    st.write(user_input)
-                
-                # Generate and display assistant response
-                with st.chat_message("assistant"):
-                    if SessionManager.is_rag_initialized() and hasattr(
-                        st.session_state, "rag_processor"
-                    ):
-                        with st.spinner("Thinking..."):
-                            try:
-                                # Get response from RAG
-                                chat_history = SessionManager.get_chat_history_for_rag()
-                                response = st.session_state.rag_processor.query(
-                                    user_input, chat_history
-                                )
-                                
-                                # Display response
-                                st.write(response["answer"])
-                                
-                                # Add assistant message to chat history
-                                SessionManager.add_message("assistant", response["answer"])
-                                
-                                # Display source documents in an expander
-                                if response["source_documents"]:
-                                    with st.expander("Source Documents"):
-                                        for i, doc in enumerate(
-                                            response["source_documents"]
-                                        ):
-                                            st.markdown(f"**Source {i+1}:**")
-                                            st.text(doc.page_content)
-                                            st.divider()
-                            except Exception as e:
-                                logger.error(
-                                    f"Error generating response: {str(e)}", exc_info=True
-                                )
-                                error_message = f"Error generating response: {str(e)}"
-                                st.error(error_message)
-                                SessionManager.add_message("assistant", error_message)
-                    else:
-                        message = "Please upload and process a document first."
-                        st.warning(message)
-                        SessionManager.add_message("assistant", message)
+        render_chat()
 
 
 def main() -> None:
@@ -381,6 +396,9 @@ def main() -> None:
     # Display chat interface
     display_chat_interface()
 
+    # Open the OCR connection before the first document is processed
+    start_ocr_warm_up()
+
 
 if __name__ == "__main__":
     main()
@@ -2,10 +2,39 @@
 OCR and RAG processing modules for document analysis and question answering.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 
-from .ocr_processor import OCRProcessor
-from .rag_processor import RAGProcessor
-from .session_manager import SessionManager
+if TYPE_CHECKING:
+    from .ocr_cache import OCRCache
+    from .ocr_processor import OCRProcessor
+    from .rag_processor import RAGProcessor
+    from .semantic_cache import SemanticCache
+    from .session_manager import SessionManager
+
+# Exports are imported on first access, so that importing a single submodule,
+# e.g. pdf_utils in a worker process, does not load every dependency of the app
+_EXPORTS = {
+    "OCRCache": ".ocr_cache",
+    "OCRProcessor": ".ocr_processor",
+    "RAGProcessor": ".rag_processor",
+    "SemanticCache": ".semantic_cache",
+    "SessionManager": ".session_manager",
+}
+
+__all__ = [
+    "OCRCache",
+    "OCRProcessor",
+    "RAGProcessor",
+    "SemanticCache",
+    "SessionManager",
+]
+
 
-__all__ = ["OCRProcessor", "RAGProcessor", "SessionManager"]
+def __getattr__(name: str) -> Any:
+    """Import an exported class from its submodule on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
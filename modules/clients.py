@@ -0,0 +1,39 @@
+# Import Libraries
+import streamlit as st
+from typing import Optional
+from .ocr_processor import OCRProcessor
+from .rag_processor import RAGProcessor
+
+
+@st.cache_resource(show_spinner=False)
+def get_ocr_processor(api_key: Optional[str] = None) -> OCRProcessor:
+    """
+    Create the OCR processor once per API key and share it across reruns.
+
+    The processor holds the Mistral client and its keep-alive connection pool,
+    so reusing it saves client setup and TLS handshakes on every rerun.
+
+    Args:
+        api_key: Mistral API key. If None, it will try to get from environment variable.
+
+    Returns:
+        The shared OCR processor
+    """
+    return OCRProcessor(api_key)
+
+
+@st.cache_resource(show_spinner=False)
+def get_rag_processor(api_key: Optional[str] = None) -> RAGProcessor:
+    """
+    Create the RAG processor's model clients once per API key, shared across reruns.
+
+    The shared processor never holds a document; call fork() on it to get a
+    session-local processor for indexing and querying.
+
+    Args:
+        api_key: Google API key. If None, it will try to get from environment variable.
+
+    Returns:
+        The shared RAG processor
+    """
+    return RAGProcessor(api_key)
@@ -0,0 +1,36 @@
+# Import Libraries
+from typing import BinaryIO
+from blake3 import blake3
+
+# Large reads let blake3 spread each update across several threads
+_READ_SIZE = 8 * 1024 * 1024
+
+
+def content_hash(data: bytes) -> str:
+    """
+    Hash some content for use as a cache key.
+
+    Args:
+        data: The raw bytes
+
+    Returns:
+        The hex BLAKE3 digest of the bytes
+    """
+    return blake3(data, max_threads=blake3.AUTO).hexdigest()
+
+
+def file_hash(file: BinaryIO) -> str:
+    """
+    Hash a file's content without reading it into memory all at once.
+
+    Args:
+        file: The file object, read from the start
+
+    Returns:
+        The hex BLAKE3 digest of the file content
+    """
+    hasher = blake3(max_threads=blake3.AUTO)
+    file.seek(0)
+    while chunk := file.read(_READ_SIZE):
+        hasher.update(chunk)
+    return hasher.hexdigest()
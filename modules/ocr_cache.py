@@ -0,0 +1,221 @@
+# Import Libraries
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import BinaryIO, Dict, Optional, Union
+from .hashing import content_hash, file_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".docuquery" / "ocr_cache.sqlite"
+DEFAULT_SIZE_LIMIT = 2 << 30
+
+
+class OCRCache:
+    """
+    A persistent cache of OCR results keyed by a hash of the source file bytes.
+
+    Once the stored text exceeds the size limit, the least recently used
+    results are evicted from disk.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        memory_size: int = 128,
+        size_limit: int = DEFAULT_SIZE_LIMIT,
+    ) -> None:
+        """
+        Open (or create) the cache database.
+
+        If the database cannot be opened, e.g. because the directory is not
+        writable, the cache keeps results in memory only.
+
+        Args:
+            path: Location of the SQLite database file
+            memory_size: Number of recent results to also keep in memory
+            size_limit: Maximum total size of the stored text in bytes
+        """
+        self.path = Path(path).expanduser()
+        self.memory_size = memory_size
+        self.size_limit = size_limit
+
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._touched: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_size = 0
+
+        try:
+            self._open()
+        except (OSError, sqlite3.Error) as e:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            logger.warning(
+                f"OCR cache unavailable at {self.path}, using memory only: {str(e)}"
+            )
+
+    def _open(self) -> None:
+        """Open the cache database, creating its schema if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_cache "
+            "(hash TEXT PRIMARY KEY, text BLOB, ts INTEGER, size INTEGER)"
+        )
+
+        # Covering indexes, so sizes and eviction order are read without
+        # touching the (possibly large) stored text
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ocr_cache_lru ON ocr_cache (ts, hash, size)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ocr_cache_size ON ocr_cache (hash, size)"
+        )
+        self._conn.commit()
+
+        # Running total of the stored text size, kept in step with every write
+        (self._total_size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM ocr_cache"
+        ).fetchone()
+
+    @staticmethod
+    def key_for(data: bytes) -> str:
+        """
+        Compute the cache key for some file content.
+
+        Args:
+            data: The raw file bytes
+
+        Returns:
+            The hex BLAKE3 digest of the bytes
+        """
+        return content_hash(data)
+
+    @staticmethod
+    def key_for_file(file: BinaryIO) -> str:
+        """
+        Compute the cache key for a file object without reading it into memory.
+
+        Args:
+            file: The file object, read from the start
+
+        Returns:
+            The hex BLAKE3 digest of the file content
+        """
+        return file_hash(file)
+
+    def _remember(self, key: str, text: str) -> None:
+        """Store a result in the in-memory layer, evicting the oldest entry."""
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _flush_touched(self) -> None:
+        """Write the timestamps of results last read from the in-memory layer."""
+        self._conn.executemany(
+            "UPDATE ocr_cache SET ts = ? WHERE hash = ?",
+            [(ts, key) for key, ts in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        """Delete least recently used results until the cache fits its size limit."""
+        if self._total_size <= self.size_limit:
+            return
+
+        stale = []
+        total = self._total_size
+        rows = self._conn.execute("SELECT hash, size FROM ocr_cache ORDER BY ts")
+        for key, size in rows:
+            if total <= self.size_limit:
+                break
+            stale.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM ocr_cache WHERE hash = ?", stale)
+        self._total_size = total
+        for (key,) in stale:
+            self._memory.pop(key, None)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached OCR result.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached text, or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+
+                # Recorded for the next write rather than committed per hit,
+                # so eviction still sees the result as recently used
+                if self._conn is not None:
+                    self._touched[key] = time.time_ns()
+                return self._memory[key]
+
+            if self._conn is None:
+                return None
+
+            try:
+                row = self._conn.execute(
+                    "SELECT text FROM ocr_cache WHERE hash = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                # Refresh the timestamp so eviction treats it as recently used
+                self._touched[key] = time.time_ns()
+                self._flush_touched()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Error reading OCR cache: {str(e)}")
+                return None
+
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, key: str, text: str) -> None:
+        """
+        Store an OCR result.
+
+        Args:
+            key: The cache key
+            text: The extracted text
+        """
+        with self._lock:
+            self._remember(key, text)
+            if self._conn is None:
+                return
+
+            size = len(text.encode())
+            total_size = self._total_size
+            try:
+                self._flush_touched()
+                row = self._conn.execute(
+                    "SELECT size FROM ocr_cache INDEXED BY ocr_cache_size "
+                    "WHERE hash = ?",
+                    (key,),
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ocr_cache (hash, text, ts, size) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, text, time.time_ns(), size),
+                )
+                self._total_size += size - (row[0] if row else 0)
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                self._touched.clear()
+                self._total_size = total_size
+                logger.warning(f"Error writing OCR cache: {str(e)}")
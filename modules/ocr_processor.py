@@ -1,26 +1,125 @@
 # Import Libraries
 import os
 import re
+import time
+import asyncio
 import logging
-import tempfile
+import threading
+import httpx
+import orjson
 from pathlib import Path
+from concurrent.futures import Future, as_completed
 from mistralai import Mistral
-from typing import Optional, Union, BinaryIO
+from pypdf.errors import PyPdfError
+from .ocr_cache import OCRCache, DEFAULT_CACHE_PATH
+from .pdf_utils import extract_page_texts
+from typing import (
+    Any,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
+# Simple Markdown removal, applied in order - this can be enhanced if needed.
+# Each pattern is paired with a substring every match contains (or None), so
+# passes that cannot match are skipped with a quick substring check.
+_MARKDOWN_PATTERNS = [
+    # Remove headers
+    ("#", re.compile(r"#{1,6}\s+"), ""),
+    # Remove bold/italic
+    (None, re.compile(r"\*\*|\*|__|\|"), ""),
+    # Remove links but keep the text
+    ("](", re.compile(r"\[([^\]]+)\]\([^)]+\)"), r"\1"),
+    # Remove code blocks but keep content
+    ("```", re.compile(r"```[a-z]*\n|```"), ""),
+    # Remove single line code
+    ("`", re.compile(r"`([^`]+)`"), r"\1"),
+    # Remove bullet points
+    (None, re.compile(r"^\s*[-*+]\s+", re.MULTILINE), ""),
+    # Remove numbered lists
+    (".", re.compile(r"^\s*\d+\.\s+", re.MULTILINE), ""),
+]
+
+# The kind of processing each accepted file type name gets
+_FILE_KINDS = {
+    "pdf": "pdf",
+    **dict.fromkeys(["image", "jpg", "jpeg", "png", "gif", "bmp", "tiff"], "image"),
+}
+
+# Fields tried in order for the text of a response without pages
+_TEXT_PATHS = [("text",), ("document", "text"), ("content",)]
+
+
+def _field(response: Any, name: str) -> Any:
+    """Read a field from an SDK response object or a plain response dict."""
+    if isinstance(response, dict):
+        return response.get(name)
+    return getattr(response, name, None)
+
+
+def _page_text(page: Any) -> str:
+    """The text of one OCR page, preferring its Markdown rendering."""
+    return _field(page, "markdown") or _field(page, "text") or ""
+
+
+# HTTP statuses and error text that mark a transient, retryable API failure
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+_RETRYABLE_MESSAGES = ("rate limit", "quota", "too many requests", "unavailable")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether an API error is a transient rate-limit or availability failure."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if getattr(error, "status_code", None) in _RETRYABLE_STATUSES:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in _RETRYABLE_MESSAGES)
+
+
+class _RateLimiter:
+    """
+    Spaces calls at least ``1 / rate`` seconds apart on the monotonic clock.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Wait until the next call slot is free and reserve it."""
+        now = time.monotonic()
+        delay = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
 class OCRProcessor:
     """
     A processor for extracting text from images and PDFs using Mistral AI's OCR capabilities.
     """
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_path: Optional[Union[str, Path]] = DEFAULT_CACHE_PATH,
+    ) -> None:
         """
         Initialize the OCR processor with Mistral AI.
 
         Args:
             api_key: Mistral AI API key. If None, it will try to get from environment variable.
+            cache_path: Location of the persistent OCR result cache. If None, caching is disabled.
 
         Raises:
             ValueError: If no API key is provided or found in environment variables.
@@ -31,12 +130,183 @@ class OCRProcessor:
                 "Mistral API key is required. Set it as an environment variable or pass it directly."
             )
 
-        self.client = Mistral(api_key=self.api_key)
+        # Long-lived HTTP pools so upload, signed-URL and OCR calls reuse
+        # keep-alive connections instead of paying a TLS handshake each time
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        self._http = httpx.Client(http2=True, timeout=60, limits=limits)
+        self._async_http = httpx.AsyncClient(http2=True, timeout=60, limits=limits)
+        self.client = Mistral(
+            api_key=self.api_key, client=self._http, async_client=self._async_http
+        )
         self.model = "mistral-ocr-latest"
+        # PDF pages with fewer embedded characters than this are treated as scans
+        self.min_native_chars = 50
+        self.cache = OCRCache(cache_path) if cache_path else None
+
+        # Async handler for each supported file type
+        self._handlers = {
+            "pdf": self.process_pdf_async,
+            "image": self.process_image_async,
+        }
+
+        # Limits shared by every Mistral call made through _call_api
+        self.max_retries = 3
+        self.retry_base_delay = 1.0
+        self.retry_max_delay = 30.0
+        self._semaphore = asyncio.Semaphore(8)
+        self._rate_limiter = _RateLimiter(rate=6.0)
+
+        # Private event loop driving the async client behind the sync methods
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    def _submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """
+        Schedule a coroutine on the processor's event loop.
 
-    def process_image(self, image_file: BinaryIO) -> str:
+        The loop runs on a daemon thread so the async client stays bound to a
+        single loop no matter which thread calls the sync methods.
         """
-        Process an image file using Mistral OCR.
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="ocr-event-loop", daemon=True
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on the processor's event loop and wait for the result."""
+        return self._submit(coro).result()
+
+    async def _call_api(
+        self,
+        call: Callable[..., Awaitable[Any]],
+        *args: Any,
+        idempotent: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Call the Mistral API within the concurrency and rate limits.
+
+        Transient failures (rate limiting, quota, 5xx, connection errors) of
+        idempotent calls are retried with exponential backoff; anything else is
+        raised immediately.
+
+        Args:
+            call: The async SDK method to call
+            *args: Positional arguments for the call
+            idempotent: Whether the call can safely be repeated. Calls that create
+                something, like uploads, are not retried: one that succeeded but
+                timed out would leave a duplicate behind on every retry.
+            **kwargs: Keyword arguments for the call
+
+        Returns:
+            The result of the call
+
+        Raises:
+            Exception: The last error, once retries are exhausted or if it is not transient
+        """
+        attempts = self.max_retries if idempotent else 1
+        for attempt in range(1, attempts + 1):
+            async with self._semaphore:
+                await self._rate_limiter.wait()
+                try:
+                    return await call(*args, **kwargs)
+                except Exception as e:
+                    if attempt == attempts or not _is_retryable(e):
+                        raise
+                    error = e
+
+            delay = min(
+                self.retry_base_delay * 2 ** (attempt - 1), self.retry_max_delay
+            )
+            logger.warning(
+                f"Mistral API call failed ({str(error)}), retrying in {delay:.0f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        """
+        Close the HTTP connection pools and stop the private event loop.
+        """
+        self._http.close()
+
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+
+        if loop is None:
+            asyncio.run(self._async_http.aclose())
+        else:
+            # The async pool belongs to the private loop, so close it there
+            asyncio.run_coroutine_threadsafe(self._async_http.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+
+    def warm_up(self) -> None:
+        """
+        Open the connection to Mistral ahead of the first OCR request.
+
+        Issues a cheap model-listing call through the async client used for OCR.
+        Failures are only logged, since warming up is purely an optimization.
+        """
+        try:
+            self._run(self._call_api(self.client.models.list_async))
+        except Exception as e:
+            logger.warning(f"Could not warm up the Mistral connection: {str(e)}")
+
+    async def _upload_async(self, content: bytes, file_name: str) -> str:
+        """
+        Upload file content to Mistral and return a signed URL for it.
+
+        Args:
+            content: The raw file bytes
+            file_name: Name to give the uploaded file
+
+        Returns:
+            Signed URL of the uploaded file
+        """
+        uploaded_file = await self._call_api(
+            self.client.files.upload_async,
+            idempotent=False,
+            file={
+                "file_name": file_name,
+                "content": content,
+            },
+            purpose="ocr",
+        )
+
+        signed_url = await self._call_api(
+            self.client.files.get_signed_url_async, file_id=uploaded_file.id
+        )
+        return signed_url.url
+
+    async def _ocr_async(
+        self, document_url: str, pages: Optional[List[int]] = None
+    ) -> Any:
+        """
+        Run Mistral OCR on an uploaded document.
+
+        Args:
+            document_url: Signed URL of the uploaded document
+            pages: Zero-based page indices to process, or None for all pages
+
+        Returns:
+            The raw OCR response
+        """
+        kwargs = {"pages": pages} if pages is not None else {}
+        return await self._call_api(
+            self.client.ocr.process_async,
+            model=self.model,
+            document={
+                "type": "document_url",
+                "document_url": document_url,
+            },
+            **kwargs,
+        )
+
+    async def process_image_async(self, image_file: BinaryIO) -> str:
+        """
+        Process an image file using Mistral OCR without blocking the event loop.
 
         Args:
             image_file: The uploaded image file object
@@ -47,115 +317,397 @@ class OCRProcessor:
         Raises:
             Exception: If there's an error processing the image
         """
-        # Create a temporary file to store the image
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as temp_file:
-            temp_file_path = temp_file.name
-            # Save the uploaded file to the temporary file
-            image_file.seek(0)
-            temp_file.write(image_file.read())
+        image_file.seek(0)
+        content = image_file.read()
 
         try:
-            # Upload the file to Mistral
-            with open(temp_file_path, "rb") as file:
-                uploaded_file = self.client.files.upload(
-                    file={
-                        "file_name": "uploaded_image.png",
-                        "content": file,
-                    },
-                    purpose="ocr",
-                )
+            document_url = await self._upload_async(content, "uploaded_image.png")
+            ocr_response = await self._ocr_async(document_url)
+            return self.extract_text_from_ocr_response(ocr_response)
+        except Exception as e:
+            logger.error(f"Error processing image with OCR: {str(e)}")
+            raise
+
+    async def process_images_async(self, image_files: List[BinaryIO]) -> List[str]:
+        """
+        Process several image files concurrently without blocking the event loop.
 
-            # Get signed URL for the uploaded file
-            signed_url = self.client.files.get_signed_url(file_id=uploaded_file.id)
+        Uploads and OCR requests share the processor's concurrency and rate
+        limits, and cached images skip OCR entirely.
 
-            # Process the document with Mistral OCR
-            ocr_response = self.client.ocr.process(
-                model=self.model,
-                document={
-                    "type": "document_url",
-                    "document_url": signed_url.url,
-                },
+        Args:
+            image_files: The uploaded image file objects
+
+        Returns:
+            Extracted text of each image, in the order given
+
+        Raises:
+            Exception: If there's an error processing any of the images
+        """
+        return await asyncio.gather(
+            *(
+                self.extract_text_async(image_file, "image")
+                for image_file in image_files
             )
+        )
 
-            # Extract text from the document
-            # The OCR response object might have different structure depending on the API version
-            # Log detailed information about the OCR response for debugging
-            logger.debug(f"OCR Response type: {type(ocr_response)}")
-            logger.debug(f"OCR Response attributes: {dir(ocr_response)}")
+    async def _prepare_pdf_async(
+        self, pdf_file: BinaryIO
+    ) -> Tuple[List[str], Optional[List[int]], Optional[str]]:
+        """
+        Read a PDF's embedded text and upload it if any page still needs OCR.
 
-            # Check for mistralai.models.ocrresponse.OCRResponse type
-            if hasattr(ocr_response, "pages") and isinstance(ocr_response.pages, list):
-                # Extract text from all pages and join them
-                all_text = []
-                for page in ocr_response.pages:
-                    # First check for markdown attribute (newer API version)
-                    if hasattr(page, "markdown"):
-                        all_text.append(page.markdown)
-                    # Fallback to text attribute for compatibility
-                    elif hasattr(page, "text"):
-                        all_text.append(page.text)
-
-                if all_text:
-                    return "\n\n".join(all_text)
-
-            # Try other possible response structures
-            if hasattr(ocr_response, "text"):
-                return ocr_response.text
-            elif hasattr(ocr_response, "document") and hasattr(
-                ocr_response.document, "text"
-            ):
-                return ocr_response.document.text
-            elif hasattr(ocr_response, "content"):
-                return ocr_response.content
-            else:
-                # Fallback: try to access response as dictionary
-                try:
-                    if isinstance(ocr_response, dict):
-                        if "text" in ocr_response:
-                            return ocr_response["text"]
-                        elif (
-                            "document" in ocr_response
-                            and "text" in ocr_response["document"]
-                        ):
-                            return ocr_response["document"]["text"]
-                        elif "content" in ocr_response:
-                            return ocr_response["content"]
-                        elif "pages" in ocr_response and isinstance(
-                            ocr_response["pages"], list
-                        ):
-                            all_text = []
-                            for page in ocr_response["pages"]:
-                                if "markdown" in page:
-                                    all_text.append(page["markdown"])
-                                elif "text" in page:
-                                    all_text.append(page["text"])
-                            if all_text:
-                                return "\n\n".join(all_text)
-                except Exception as e:
-                    logger.debug(
-                        f"Error trying to access response as dictionary: {str(e)}"
-                    )
+        PDFs that cannot be read locally, e.g. encrypted or malformed ones, are
+        uploaded for OCR of the whole document.
+
+        Args:
+            pdf_file: The uploaded PDF file object
+
+        Returns:
+            A tuple of (text per page, indices of pages needing OCR or None for
+            the whole document, signed URL of the upload or None when no page
+            needs OCR)
+        """
+        pdf_file.seek(0)
+        content = pdf_file.read()
+
+        # Parsing large PDFs is CPU-bound, so keep it off the event loop
+        try:
+            page_texts = await asyncio.to_thread(extract_page_texts, content)
+        except (PyPdfError, OSError) as e:
+            logger.warning(
+                f"Could not read PDF text, using OCR for all pages: {str(e)}"
+            )
+            document_url = await self._upload_async(content, "uploaded_file.pdf")
+            return [], None, document_url
+
+        ocr_pages = [
+            index
+            for index, text in enumerate(page_texts)
+            if len(text.strip()) < self.min_native_chars
+        ]
+
+        # Skip the upload entirely when every page has native text
+        document_url = None
+        if ocr_pages:
+            document_url = await self._upload_async(content, "uploaded_file.pdf")
+
+        return page_texts, ocr_pages, document_url
+
+    def _merge_ocr_pages(
+        self,
+        page_texts: List[str],
+        batches: List[List[int]],
+        ocr_responses: List[Any],
+    ) -> str:
+        """
+        Fill OCR results into a PDF's page texts and join them in page order.
+
+        Args:
+            page_texts: Embedded text per page, updated in place
+            batches: The page indices each OCR request covered
+            ocr_responses: The OCR response for each batch
+
+        Returns:
+            The text of the whole PDF
+        """
+        for pages, ocr_response in zip(batches, ocr_responses):
+            page_texts_by_index = self._ocr_page_texts(ocr_response, pages)
+            for index in pages:
+                page_texts[index] = page_texts_by_index.get(index, "")
+
+        return "\n\n".join(text for text in page_texts if text)
+
+    async def process_pdf_async(self, pdf_file: BinaryIO, batch_size: int = 8) -> str:
+        """
+        Process a PDF file using Mistral OCR without blocking the event loop.
+
+        Pages that already carry at least ``min_native_chars`` characters of
+        embedded text are used as-is. Only the remaining (scanned) pages are
+        sent to OCR: the PDF is uploaded and signed once, then OCR requests of
+        up to ``batch_size`` pages each are issued concurrently. A PDF that
+        cannot be read locally is sent to OCR whole, in a single request.
+
+        Args:
+            pdf_file: The uploaded PDF file object
+            batch_size: Maximum number of pages per OCR request
+
+        Returns:
+            Extracted text from the PDF, in page order
+
+        Raises:
+            ValueError: If batch_size is not positive
+            Exception: If there's an error processing the PDF
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
 
-                # If we get here, we need to inspect the response structure
-                logger.info(
-                    f"OCR Response structure: {type(ocr_response)}, attrs: {dir(ocr_response)}"
+        try:
+            page_texts, ocr_pages, document_url = await self._prepare_pdf_async(
+                pdf_file
+            )
+            if ocr_pages is None:
+                return self.extract_text_from_ocr_response(
+                    await self._ocr_async(document_url)
                 )
+
+            batches = [
+                ocr_pages[start : start + batch_size]
+                for start in range(0, len(ocr_pages), batch_size)
+            ]
+            ocr_responses = await asyncio.gather(
+                *(self._ocr_async(document_url, pages) for pages in batches)
+            )
+
+            return self._merge_ocr_pages(page_texts, batches, ocr_responses)
+        except Exception as e:
+            logger.error(f"Error processing PDF with OCR: {str(e)}")
+            raise
+
+    async def _run_batch_job_async(
+        self,
+        requests: Dict[str, Dict[str, Any]],
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ) -> Dict[str, Any]:
+        """
+        Run OCR requests as one Mistral batch job and wait for the results.
+
+        Args:
+            requests: OCR request bodies keyed by custom ID
+            poll_interval: Initial delay between job status checks, in seconds
+            max_poll_interval: Upper bound for the doubling poll delay, in seconds
+
+        Returns:
+            The OCR response body for each custom ID
+
+        Raises:
+            ValueError: If the job or any of its requests fails
+        """
+        # orjson writes bytes directly, so the payload is never built as a str
+        payload = b"\n".join(
+            orjson.dumps({"custom_id": custom_id, "body": body})
+            for custom_id, body in requests.items()
+        )
+
+        batch_file = await self._call_api(
+            self.client.files.upload_async,
+            idempotent=False,
+            file={
+                "file_name": "ocr_batch.jsonl",
+                "content": payload,
+            },
+            purpose="batch",
+        )
+        job = await self._call_api(
+            self.client.batch.jobs.create_async,
+            idempotent=False,
+            input_files=[batch_file.id],
+            endpoint="/v1/ocr",
+            model=self.model,
+        )
+
+        # Poll with exponential backoff until the job leaves the queue
+        delay = poll_interval
+        while job.status in ("QUEUED", "RUNNING"):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            job = await self._call_api(self.client.batch.jobs.get_async, job_id=job.id)
+
+        if job.status != "SUCCESS" or not job.output_file:
+            raise ValueError(f"Batch OCR job {job.id} ended with status {job.status}")
+
+        output = await self._call_api(
+            self.client.files.download_async, file_id=job.output_file
+        )
+        results = {}
+        for line in (await output.aread()).splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            if record.get("error"):
                 raise ValueError(
-                    f"Could not extract text from OCR response. Response type: {type(ocr_response)}"
+                    f"Batch OCR request {record['custom_id']} failed: {record['error']}"
                 )
+            results[record["custom_id"]] = record["response"]["body"]
+
+        missing = requests.keys() - results.keys()
+        if missing:
+            raise ValueError(f"Batch OCR job {job.id} returned no result for {missing}")
+
+        return results
+
+    async def process_pdf_batch_async(
+        self, pdf_files: List[BinaryIO], max_pages_per_request: int = 1000
+    ) -> List[str]:
+        """
+        Process several PDF files with a single Mistral batch OCR job.
+
+        Documents already in the OCR cache are served from it. For the rest,
+        pages with embedded text are used as-is, as in process_pdf_async, and
+        the remaining pages of every document are submitted together as one
+        batch job, with each request kept under the OCR endpoint's page limit.
+
+        Args:
+            pdf_files: The uploaded PDF file objects
+            max_pages_per_request: Maximum number of pages per OCR request
+
+        Returns:
+            Extracted text of each PDF, in the order given
+
+        Raises:
+            ValueError: If the batch job fails
+            Exception: If there's an error processing the PDFs
+        """
+        try:
+            # Cached documents skip preparation and the batch job entirely
+            texts: List[Optional[str]] = [None] * len(pdf_files)
+            cache_keys: List[Optional[str]] = [None] * len(pdf_files)
+            if self.cache is not None:
+                for index, pdf_file in enumerate(pdf_files):
+                    cache_keys[index] = self._cache_key(pdf_file)
+                    texts[index] = self.cache.get(cache_keys[index])
+            pending = [index for index, text in enumerate(texts) if text is None]
+
+            documents = await asyncio.gather(
+                *(self._prepare_pdf_async(pdf_files[index]) for index in pending)
+            )
+
+            # One request per run of at most max_pages_per_request OCR pages
+            requests = {}
+            document_batches = []
+            for document_index, (_, ocr_pages, document_url) in enumerate(documents):
+                document = {"type": "document_url", "document_url": document_url}
+                if ocr_pages is None:
+                    requests[f"{document_index}:all"] = {"document": document}
+                    document_batches.append(None)
+                    continue
+
+                batches = [
+                    ocr_pages[start : start + max_pages_per_request]
+                    for start in range(0, len(ocr_pages), max_pages_per_request)
+                ]
+                for pages in batches:
+                    requests[f"{document_index}:{pages[0]}"] = {
+                        "document": document,
+                        "pages": pages,
+                    }
+                document_batches.append(batches)
+
+            results = await self._run_batch_job_async(requests) if requests else {}
+
+            for document_index, ((page_texts, _, _), batches) in enumerate(
+                zip(documents, document_batches)
+            ):
+                if batches is None:
+                    text = self.extract_text_from_ocr_response(
+                        results[f"{document_index}:all"]
+                    )
+                else:
+                    text = self._merge_ocr_pages(
+                        page_texts,
+                        batches,
+                        [results[f"{document_index}:{pages[0]}"] for pages in batches],
+                    )
+                index = pending[document_index]
+                texts[index] = text
+                if self.cache is not None:
+                    self.cache.set(cache_keys[index], text)
+
+            return texts
         except Exception as e:
-            logger.error(f"Error processing image with OCR: {str(e)}")
+            logger.error(f"Error processing PDFs with batch OCR: {str(e)}")
             raise
+
+    def _cache_key(self, file: BinaryIO) -> str:
+        """The OCR cache key for a file, covering both its content and the model."""
+        return f"{self.model}:{OCRCache.key_for_file(file)}"
+
+    def _ocr_page_texts(self, ocr_response: Any, pages: List[int]) -> Dict[int, str]:
+        """
+        Map the text of an OCR response back to the page indices it was run on.
+
+        Args:
+            ocr_response: The OCR response object (or batch response body) from Mistral AI
+            pages: The page indices the request covered, in order
+
+        Returns:
+            Text per page index
+        """
+        response_pages = _field(ocr_response, "pages")
+        if isinstance(response_pages, list) and len(response_pages) == len(pages):
+            return {
+                index: _page_text(page) for index, page in zip(pages, response_pages)
+            }
+
+        # Unknown response shape: keep the batch's text together on its first page
+        return {pages[0]: self.extract_text_from_ocr_response(ocr_response)}
+
+    def process_image(self, image_file: BinaryIO) -> str:
+        """
+        Process an image file using Mistral OCR.
+
+        Args:
+            image_file: The uploaded image file object
+
+        Returns:
+            Extracted text from the image
+
+        Raises:
+            Exception: If there's an error processing the image
+        """
+        return self._run(self.process_image_async(image_file))
+
+    def process_images(self, image_files: List[BinaryIO]) -> List[str]:
+        """
+        Process several image files concurrently using Mistral OCR.
+
+        Args:
+            image_files: The uploaded image file objects
+
+        Returns:
+            Extracted text of each image, in the order given
+
+        Raises:
+            Exception: If there's an error processing any of the images
+        """
+        return self._run(self.process_images_async(image_files))
+
+    def iter_images(self, image_files: List[BinaryIO]) -> Iterator[Tuple[int, str]]:
+        """
+        Process several image files concurrently, yielding each result as it completes.
+
+        Lets a UI show each image's text as soon as it is ready instead of
+        waiting for the whole set.
+
+        Args:
+            image_files: The uploaded image file objects
+
+        Yields:
+            (index in image_files, extracted text) pairs, in completion order
+
+        Raises:
+            Exception: If there's an error processing any of the images
+        """
+        futures = {
+            self._submit(self.extract_text_async(image_file, "image")): index
+            for index, image_file in enumerate(image_files)
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
         finally:
-            # Clean up the temporary file
-            Path(temp_file_path).unlink(missing_ok=True)
+            # Stop outstanding requests if a result failed or the caller stopped early
+            for future in futures:
+                future.cancel()
 
-    def process_pdf(self, pdf_file: BinaryIO) -> str:
+    def process_pdf(self, pdf_file: BinaryIO, batch_size: int = 8) -> str:
         """
         Process a PDF file using Mistral OCR.
 
         Args:
             pdf_file: The uploaded PDF file object
+            batch_size: Maximum number of pages per OCR request
 
         Returns:
             Extracted text from the PDF
@@ -163,108 +715,63 @@ class OCRProcessor:
         Raises:
             Exception: If there's an error processing the PDF
         """
-        # Create a temporary file to store the PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file_path = temp_file.name
-            # Save the uploaded file to the temporary file
-            pdf_file.seek(0)
-            temp_file.write(pdf_file.read())
+        return self._run(self.process_pdf_async(pdf_file, batch_size))
 
-        try:
-            # Upload the file to Mistral
-            with open(temp_file_path, "rb") as file:
-                uploaded_file = self.client.files.upload(
-                    file={
-                        "file_name": "uploaded_file.pdf",
-                        "content": file,
-                    },
-                    purpose="ocr",
-                )
+    def process_pdf_batch(
+        self, pdf_files: List[BinaryIO], max_pages_per_request: int = 1000
+    ) -> List[str]:
+        """
+        Process several PDF files with a single Mistral batch OCR job.
 
-            # Get signed URL for the uploaded file
-            signed_url = self.client.files.get_signed_url(file_id=uploaded_file.id)
+        Args:
+            pdf_files: The uploaded PDF file objects
+            max_pages_per_request: Maximum number of pages per OCR request
 
-            # Process the document with Mistral OCR
-            ocr_response = self.client.ocr.process(
-                model=self.model,
-                document={
-                    "type": "document_url",
-                    "document_url": signed_url.url,
-                },
-            )
+        Returns:
+            Extracted text of each PDF, in the order given
 
-            # Extract text from the document
-            # The OCR response object might have different structure depending on the API version
-            # Log detailed information about the OCR response for debugging
-            logger.debug(f"OCR Response type: {type(ocr_response)}")
-            logger.debug(f"OCR Response attributes: {dir(ocr_response)}")
+        Raises:
+            ValueError: If the batch job fails
+            Exception: If there's an error processing the PDFs
+        """
+        return self._run(self.process_pdf_batch_async(pdf_files, max_pages_per_request))
 
-            # Check for mistralai.models.ocrresponse.OCRResponse type
-            if hasattr(ocr_response, "pages") and isinstance(ocr_response.pages, list):
-                # Extract text from all pages and join them
-                all_text = []
-                for page in ocr_response.pages:
-                    # First check for markdown attribute (newer API version)
-                    if hasattr(page, "markdown"):
-                        all_text.append(page.markdown)
-                    # Fallback to text attribute for compatibility
-                    elif hasattr(page, "text"):
-                        all_text.append(page.text)
-
-                if all_text:
-                    return "\n\n".join(all_text)
-
-            # Try other possible response structures
-            if hasattr(ocr_response, "text"):
-                return ocr_response.text
-            elif hasattr(ocr_response, "document") and hasattr(
-                ocr_response.document, "text"
-            ):
-                return ocr_response.document.text
-            elif hasattr(ocr_response, "content"):
-                return ocr_response.content
-            else:
-                # Fallback: try to access response as dictionary
-                try:
-                    if isinstance(ocr_response, dict):
-                        if "text" in ocr_response:
-                            return ocr_response["text"]
-                        elif (
-                            "document" in ocr_response
-                            and "text" in ocr_response["document"]
-                        ):
-                            return ocr_response["document"]["text"]
-                        elif "content" in ocr_response:
-                            return ocr_response["content"]
-                        elif "pages" in ocr_response and isinstance(
-                            ocr_response["pages"], list
-                        ):
-                            all_text = []
-                            for page in ocr_response["pages"]:
-                                if "markdown" in page:
-                                    all_text.append(page["markdown"])
-                                elif "text" in page:
-                                    all_text.append(page["text"])
-                            if all_text:
-                                return "\n\n".join(all_text)
-                except Exception as e:
-                    logger.debug(
-                        f"Error trying to access response as dictionary: {str(e)}"
-                    )
+    def process_many(self, files: List[Tuple[BinaryIO, str]]) -> List[str]:
+        """
+        Extract text from several files concurrently.
 
-                # If we get here, we need to inspect the response structure
-                logger.info(
-                    f"OCR Response structure: {type(ocr_response)}, attrs: {dir(ocr_response)}"
-                )
-                raise ValueError(
-                    f"Could not extract text from OCR response. Response type: {type(ocr_response)}"
-                )
-        except Exception as e:
-            logger.error(f"Error processing PDF with OCR: {str(e)}")
-            raise
-        finally:
-            # Clean up the temporary file
-            Path(temp_file_path).unlink(missing_ok=True)
+        Args:
+            files: (file object, file type) pairs
+
+        Returns:
+            Extracted text of each file, in the order given
+
+        Raises:
+            ValueError: If a file type is not supported
+            Exception: If there's an error processing any of the files
+        """
+        return self._run(self.process_many_async(files))
+
+    async def process_many_async(self, files: List[Tuple[BinaryIO, str]]) -> List[str]:
+        """
+        Extract text from several files concurrently without blocking the event loop.
+
+        Requests from all files share the processor's concurrency and rate
+        limits, so N uploads finish in roughly max(N / rate, latency).
+
+        Args:
+            files: (file object, file type) pairs
+
+        Returns:
+            Extracted text of each file, in the order given
+
+        Raises:
+            ValueError: If a file type is not supported
+            Exception: If there's an error processing any of the files
+        """
+        return await asyncio.gather(
+            *(self.extract_text_async(file, file_type) for file, file_type in files)
+        )
 
     def extract_text(
         self, file: BinaryIO, file_type: str, strip_markdown: bool = False
@@ -283,38 +790,54 @@ class OCRProcessor:
         Raises:
             ValueError: If the file type is not supported
         """
-        if file_type.lower() == "pdf":
-            text = self.process_pdf(file)
-        elif file_type.lower() in ["image", "jpg", "jpeg", "png", "gif", "bmp", "tiff"]:
-            text = self.process_image(file)
-        else:
+        return self._run(self.extract_text_async(file, file_type, strip_markdown))
+
+    async def extract_text_async(
+        self, file: BinaryIO, file_type: str, strip_markdown: bool = False
+    ) -> str:
+        """
+        Extract text from a file without blocking the event loop.
+
+        Args:
+            file: The uploaded file object
+            file_type: The type of the file ('pdf', 'image', etc.)
+            strip_markdown: If True, attempt to strip Markdown formatting from the result
+
+        Returns:
+            Extracted text from the file
+
+        Raises:
+            ValueError: If the file type is not supported
+        """
+        kind = _FILE_KINDS.get(file_type.lower())
+        if kind is None:
             raise ValueError(f"Unsupported file type: {file_type}")
+        process = self._handlers[kind]
+
+        # Identical uploads are served from the cache instead of re-running OCR
+        text = None
+        if self.cache is not None:
+            cache_key = self._cache_key(file)
+            text = self.cache.get(cache_key)
+
+        if text is None:
+            text = await process(file)
+            if self.cache is not None:
+                self.cache.set(cache_key, text)
 
         if strip_markdown and text:
-            # Simple Markdown removal - this can be enhanced if needed
-            # Remove headers
-            text = re.sub(r"#{1,6}\s+", "", text)
-            # Remove bold/italic
-            text = re.sub(r"\*\*|\*|__|\|", "", text)
-            # Remove links but keep the text
-            text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-            # Remove code blocks but keep content
-            text = re.sub(r"```[a-z]*\n|```", "", text)
-            # Remove single line code
-            text = re.sub(r"`([^`]+)`", r"\1", text)
-            # Remove bullet points
-            text = re.sub(r"^\s*[-*+]\s+", "", text, flags=re.MULTILINE)
-            # Remove numbered lists
-            text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
+            for marker, pattern, replacement in _MARKDOWN_PATTERNS:
+                if marker is None or marker in text:
+                    text = pattern.sub(replacement, text)
 
         return text
 
-    def extract_text_from_ocr_response(self, ocr_response) -> str:
+    def extract_text_from_ocr_response(self, ocr_response: Any) -> str:
         """
         Extract text from the OCR response object.
 
         Args:
-            ocr_response: The OCR response object from Mistral AI
+            ocr_response: The OCR response object (or batch response body) from Mistral AI
 
         Returns:
             Extracted text from the response
@@ -322,71 +845,23 @@ class OCRProcessor:
         Raises:
             ValueError: If text cannot be extracted from the response
         """
-        # Log detailed information about the OCR response for debugging
-        logger.debug(f"OCR Response type: {type(ocr_response)}")
-        logger.debug(f"OCR Response attributes: {dir(ocr_response)}")
-
-        # Check for mistralai.models.ocrresponse.OCRResponse type
-        if hasattr(ocr_response, "pages") and isinstance(ocr_response.pages, list):
-            # Extract text from all pages and join them
-            all_text = []
-            for page in ocr_response.pages:
-                # First check for markdown attribute (newer API version)
-                if hasattr(page, "markdown"):
-                    all_text.append(page.markdown)
-                # Fallback to text attribute for compatibility
-                elif hasattr(page, "text"):
-                    all_text.append(page.text)
-
-            if all_text:
-                return "\n\n".join(all_text)
-
-        # Try other possible response structures
-        if hasattr(ocr_response, "text"):
-            return ocr_response.text
-        elif hasattr(ocr_response, "document") and hasattr(
-            ocr_response.document, "text"
-        ):
-            return ocr_response.document.text
-        elif hasattr(ocr_response, "content"):
-            return ocr_response.content
-        else:
-            # Fallback: try to access response as dictionary
-            try:
-                if isinstance(ocr_response, dict):
-                    if "text" in ocr_response:
-                        return ocr_response["text"]
-                    elif (
-                        "document" in ocr_response
-                        and "text" in ocr_response["document"]
-                    ):
-                        return ocr_response["document"]["text"]
-                    elif "content" in ocr_response:
-                        return ocr_response["content"]
-                    elif "pages" in ocr_response and isinstance(
-                        ocr_response["pages"], list
-                    ):
-                        all_text = []
-                        for page in ocr_response["pages"]:
-                            if "markdown" in page:
-                                all_text.append(page["markdown"])
-                            elif "text" in page:
-                                all_text.append(page["text"])
-                        if all_text:
-                            return "\n\n".join(all_text)
-            except Exception as e:
-                logger.debug(f"Error trying to access response as dictionary: {str(e)}")
-
-            # If we get here, we need to inspect the response structure
-            logger.info(
-                f"OCR Response structure: {type(ocr_response)}, attrs: {dir(ocr_response)}"
-            )
-            if hasattr(ocr_response, "pages"):
-                logger.info(
-                    f"Pages attribute exists with {len(ocr_response.pages)} pages"
-                )
-                if len(ocr_response.pages) > 0:
-                    logger.info(f"First page attributes: {dir(ocr_response.pages[0])}")
-            raise ValueError(
-                f"Could not extract text from OCR response. Response type: {type(ocr_response)}"
-            )
+        # dir() builds a list of every attribute name, so only pay for it when
+        # debug logging is actually on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"OCR Response type: {type(ocr_response)}")
+            logger.debug(f"OCR Response attributes: {dir(ocr_response)}")
+
+        pages = _field(ocr_response, "pages")
+        if isinstance(pages, list) and pages:
+            return "\n\n".join(_page_text(page) for page in pages)
+
+        for path in _TEXT_PATHS:
+            value = ocr_response
+            for name in path:
+                value = _field(value, name)
+            if value is not None:
+                return value
+
+        raise ValueError(
+            f"Could not extract text from OCR response. Response type: {type(ocr_response)}"
+        )
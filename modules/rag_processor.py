@@ -1,20 +1,63 @@
 # Import Libraries
 import os
-import docx
-import PyPDF2
-import tempfile
+import copy
 import logging
+import tempfile
 from pathlib import Path
-import google.generativeai as genai
-from langchain_community.vectorstores import FAISS
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.chains import ConversationalRetrievalChain
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from typing import Optional, Union, BinaryIO, Dict, List, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# LangChain, FAISS, Gemini and the document parsers take seconds to import, so
+# they are imported where they are first used rather than at app startup
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
 
 # Configure logging for FAISS
 logging.getLogger("faiss").setLevel(logging.ERROR)  # Suppress FAISS warnings
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBED_CACHE_PATH = Path.home() / ".docuquery" / "embed_cache"
+
+# WordprocessingML namespace, as an lxml tag prefix
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Text written by run elements other than <w:t>
+_W_BREAKS = {f"{_W}tab": "\t", f"{_W}br": "\n", f"{_W}cr": "\n"}
+
+
+def _docx_runs(paragraph: Any) -> Iterator[Any]:
+    """The runs of a .docx paragraph, including those inside hyperlinks, in order."""
+    for child in paragraph:
+        if child.tag == f"{_W}r":
+            yield child
+        elif child.tag == f"{_W}hyperlink":
+            yield from child.iterfind(f"{_W}r")
+
+
+def _docx_paragraph_text(paragraph: Any) -> str:
+    """
+    The text of a .docx paragraph's own runs.
+
+    Only direct children of each run are read, so text boxes, whose content
+    appears under both mc:Choice and mc:Fallback, are skipped, not repeated.
+    """
+    return "".join(
+        _W_BREAKS.get(node.tag) or node.text or ""
+        for run in _docx_runs(paragraph)
+        for node in run
+        if node.tag == f"{_W}t" or node.tag in _W_BREAKS
+    )
+
 
 # Define RAGProcessor Class
 class RAGProcessor:
@@ -22,12 +65,17 @@ class RAGProcessor:
     A processor for Retrieval-Augmented Generation (RAG) using Google Gemini models.
     """
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        embed_cache_path: Optional[Union[str, Path]] = DEFAULT_EMBED_CACHE_PATH,
+    ) -> None:
         """
         Initialize the RAG processor with Google Gemini Flash 2.0.
 
         Args:
             api_key: Google API key. If None, it will try to get from environment variable.
+            embed_cache_path: Directory of the persistent chunk embedding cache. If None, caching is disabled.
 
         Raises:
             ValueError: If no API key is provided or found in environment variables.
@@ -38,14 +86,50 @@ class RAGProcessor:
                 "Google API key is required. Set it as an environment variable or pass it directly."
             )
 
+        import google.generativeai as genai
+        from langchain.storage import LocalFileStore
+        from langchain.embeddings import CacheBackedEmbeddings
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        from .hashing import content_hash
+
         # Configure the Google Generative AI
         genai.configure(api_key=self.api_key)
 
         # Initialize embeddings model
+        embedding_model = "models/embedding-001"
         self.embeddings = GoogleGenerativeAIEmbeddings(
-            model="models/embedding-001", google_api_key=self.api_key
+            model=embedding_model, google_api_key=self.api_key
         )
 
+        # Reuse stored vectors for chunks that were embedded before, e.g. when
+        # the same document is processed again; keys cover the model as well.
+        # If the directory is not writable, chunks are embedded uncached
+        embed_cache_dir = (
+            Path(embed_cache_path).expanduser() if embed_cache_path else None
+        )
+        if embed_cache_dir is not None:
+            try:
+                embed_cache_dir.mkdir(parents=True, exist_ok=True)
+                with tempfile.TemporaryFile(dir=embed_cache_dir):
+                    pass
+            except OSError as e:
+                logger.warning(
+                    f"Embedding cache unavailable at {embed_cache_dir}, "
+                    f"embedding without it: {str(e)}"
+                )
+                embed_cache_dir = None
+
+        if embed_cache_dir is not None:
+            self.embeddings = CacheBackedEmbeddings.from_bytes_store(
+                self.embeddings,
+                LocalFileStore(embed_cache_dir),
+                key_encoder=lambda text: content_hash(
+                    f"{embedding_model}\n{text}".encode()
+                ),
+            )
+
         # Initialize LLM - using the latest Gemini model
         self.llm = ChatGoogleGenerativeAI(
             model="gemini-2.0-flash",  # Updated to the latest model
@@ -63,13 +147,38 @@ class RAGProcessor:
             separators=["\n\n", "\n", ". ", " ", ""],
         )
 
+        # Chunks per embedding request, and how many requests run at once
+        self.embed_batch_size = 100
+        self.embed_workers = 8
+
+        # Documents with at least this many chunks get an approximate HNSW
+        # index; below it a brute-force scan is as fast and exact
+        self.hnsw_min_chunks = 10_000
+
         self.vector_store = None
         self.retrieval_chain = None
+        # Hashes of the chunks already in the vector store
+        self._seen_hashes = set()
+
+    def fork(self) -> "RAGProcessor":
+        """
+        Create a processor that shares this one's models but has no document loaded.
+
+        Returns:
+            A new RAGProcessor ready to process a document
+        """
+        forked = copy.copy(self)
+        forked.vector_store = None
+        forked.retrieval_chain = None
+        forked._seen_hashes = set()
+        return forked
 
     def extract_text_from_pdf(self, pdf_file: BinaryIO) -> str:
         """
         Extract text from a PDF file.
 
+        Large PDFs have their pages extracted in parallel worker processes.
+
         Args:
             pdf_file: The uploaded PDF file object
 
@@ -79,25 +188,11 @@ class RAGProcessor:
         Raises:
             Exception: If there's an error processing the PDF
         """
-        # Create a temporary file to store the PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file_path = temp_file.name
-            # Save the uploaded file to the temporary file
-            pdf_file.seek(0)
-            temp_file.write(pdf_file.read())
-
-        try:
-            # Extract text from the PDF
-            text = ""
-            with open(temp_file_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n\n"
-            return text
-        finally:
-            # Clean up the temporary file
-            Path(temp_file_path).unlink(missing_ok=True)
+        from .pdf_utils import extract_page_texts
+
+        # Workers receive the raw bytes, so no temporary file is needed
+        pdf_file.seek(0)
+        return "\n\n".join(extract_page_texts(pdf_file.read()))
 
     def extract_text_from_docx(self, docx_file: BinaryIO) -> str:
         """
@@ -112,32 +207,115 @@ class RAGProcessor:
         Raises:
             Exception: If there's an error processing the Word document
         """
-        # Create a temporary file to store the Word document
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as temp_file:
-            temp_file_path = temp_file.name
-            # Save the uploaded file to the temporary file
-            docx_file.seek(0)
-            temp_file.write(docx_file.read())
-
-        try:
-            # Extract text from the Word document
-            doc = docx.Document(temp_file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-
-            # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
-                text += "\n"
-
-            return text
-        finally:
-            # Clean up the temporary file
-            Path(temp_file_path).unlink(missing_ok=True)
+        import zipfile
+        from lxml import etree
+
+        # The XML comes from an untrusted upload, so never resolve entities or
+        # fetch anything over the network while parsing it
+        parser = etree.XMLParser(resolve_entities=False, no_network=True)
+
+        # Parse the document XML directly; the upload is a seekable in-memory file
+        docx_file.seek(0)
+        with zipfile.ZipFile(docx_file) as archive:
+            with archive.open("word/document.xml") as document_xml:
+                body = etree.parse(document_xml, parser).getroot().find(f"{_W}body")
+
+        # Walk top-level paragraphs and tables in document order
+        blocks = []
+        for element in body:
+            if element.tag == f"{_W}p":
+                blocks.append(_docx_paragraph_text(element))
+            elif element.tag == f"{_W}tbl":
+                rows = (
+                    " ".join(
+                        "\n".join(
+                            _docx_paragraph_text(paragraph)
+                            for paragraph in cell.iterfind(f"{_W}p")
+                        )
+                        for cell in row.iterfind(f"{_W}tc")
+                    )
+                    for row in element.iterfind(f"{_W}tr")
+                )
+                blocks.append("\n".join(rows) + "\n")
+
+        return "\n".join(blocks)
+
+    # Text extractor for each supported file type
+    _EXTRACTORS = {"pdf": extract_text_from_pdf, "docx": extract_text_from_docx}
+
+    def embed_chunks(self, chunks: List[str]) -> List[List[float]]:
+        """
+        Embed text chunks in batches, with several batches in flight at once.
+
+        Args:
+            chunks: The text chunks to embed
+
+        Returns:
+            The embedding of each chunk, in the order given
+        """
+        batches = [
+            chunks[start : start + self.embed_batch_size]
+            for start in range(0, len(chunks), self.embed_batch_size)
+        ]
+        if len(batches) < 2:
+            return self.embeddings.embed_documents(chunks) if chunks else []
+
+        # Embedding requests are network-bound, so threads overlap them well
+        with ThreadPoolExecutor(
+            max_workers=min(self.embed_workers, len(batches))
+        ) as executor:
+            return [
+                vector
+                for vectors in executor.map(self.embeddings.embed_documents, batches)
+                for vector in vectors
+            ]
+
+    def build_vector_store(
+        self, chunks: List[str], vectors: List[List[float]]
+    ) -> "FAISS":
+        """
+        Index embedded chunks, using an HNSW graph for large documents.
+
+        Args:
+            chunks: The text chunks
+            vectors: The embedding of each chunk
+
+        Returns:
+            The vector store, with each chunk's index in its "chunk" metadata
+        """
+        from langchain_core.documents import Document
+        from langchain_community.vectorstores import FAISS
+        from langchain_community.docstore.in_memory import InMemoryDocstore
+
+        metadatas = [{"chunk": index} for index in range(len(chunks))]
+        if len(chunks) < self.hnsw_min_chunks:
+            return FAISS.from_embeddings(
+                text_embeddings=list(zip(chunks, vectors)),
+                embedding=self.embeddings,
+                metadatas=metadatas,
+            )
+
+        import faiss
+        import numpy as np
+
+        index = faiss.IndexHNSWFlat(len(vectors[0]), 32)
+        index.hnsw.efConstruction = 200
+        index.hnsw.efSearch = 64
+        index.add(np.asarray(vectors, dtype=np.float32))
+
+        ids = [str(position) for position in range(len(chunks))]
+        docstore = InMemoryDocstore(
+            {
+                id_: Document(page_content=chunk, metadata=metadata)
+                for id_, chunk, metadata in zip(ids, chunks, metadatas)
+            }
+        )
+        return FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=dict(enumerate(ids)),
+        )
 
     def process_document(
         self,
@@ -148,6 +326,12 @@ class RAGProcessor:
         """
         Process a document for RAG.
 
+        If a document was already processed, only chunks that are not yet
+        indexed are embedded and added to the existing vector store. Use fork()
+        to start a fresh index instead. The index type is chosen when the store
+        is first built, so a flat index that later grows past hnsw_min_chunks
+        stays flat.
+
         Args:
             file: The uploaded file object (optional)
             file_type: The type of the file ('pdf' or 'docx') (optional)
@@ -160,40 +344,66 @@ class RAGProcessor:
             ValueError: If neither file nor text is provided, or if the file type is not supported
             Exception: If there's an error processing the document
         """
+        from .hashing import content_hash
+        from .retrievers import StableOrderRetriever
+        from langchain.chains import ConversationalRetrievalChain
+
         # Extract text from file if provided
         if file and file_type:
-            match file_type.lower():
-                case "pdf":
-                    document_text = self.extract_text_from_pdf(file)
-                case "docx":
-                    document_text = self.extract_text_from_docx(file)
-                case _:
-                    raise ValueError(f"Unsupported file type for RAG: {file_type}")
+            extract = self._EXTRACTORS.get(file_type.lower())
+            if extract is None:
+                raise ValueError(f"Unsupported file type for RAG: {file_type}")
+            document_text = extract(self, file)
         elif text:
             document_text = text
         else:
             raise ValueError("Either file or text must be provided")
 
-        # Split text into chunks
-        chunks = self.text_splitter.split_text(document_text)
-
-        # Create vector store
-        self.vector_store = FAISS.from_texts(chunks, self.embeddings)
+        # Split text into chunks, keeping only those not indexed yet. Their
+        # hashes are only recorded once indexing succeeds, so a failed attempt
+        # can be retried with the same document.
+        new_chunks: Dict[str, str] = {}
+        for chunk in self.text_splitter.split_text(document_text):
+            chunk_hash = content_hash(chunk.encode())
+            if chunk_hash not in self._seen_hashes:
+                new_chunks.setdefault(chunk_hash, chunk)
+        chunks = list(new_chunks.values())
+
+        if self.vector_store is not None:
+            # Extend the existing index; the retrieval chain already searches it
+            if chunks:
+                start = self.vector_store.index.ntotal
+                self.vector_store.add_embeddings(
+                    text_embeddings=list(zip(chunks, self.embed_chunks(chunks))),
+                    metadatas=[
+                        {"chunk": start + index} for index in range(len(chunks))
+                    ],
+                )
+            self._seen_hashes.update(new_chunks)
+            return True
+
+        # Create vector store from embeddings computed in concurrent batches
+        vector_store = self.build_vector_store(chunks, self.embed_chunks(chunks))
 
         # Create retrieval chain with improved configuration
-        self.retrieval_chain = ConversationalRetrievalChain.from_llm(
+        retrieval_chain = ConversationalRetrievalChain.from_llm(
             llm=self.llm,
-            retriever=self.vector_store.as_retriever(
-                search_type="mmr",  # Use Maximum Marginal Relevance for better diversity
-                search_kwargs={
-                    "k": 5,
-                    "fetch_k": 10,
-                },  # Retrieve more documents for better context
+            retriever=StableOrderRetriever(
+                retriever=vector_store.as_retriever(
+                    search_type="mmr",  # Use Maximum Marginal Relevance for better diversity
+                    search_kwargs={
+                        "k": 5,
+                        "fetch_k": 10,
+                    },  # Retrieve more documents for better context
+                )
             ),
             return_source_documents=True,
             verbose=True,
         )
 
+        self.vector_store = vector_store
+        self.retrieval_chain = retrieval_chain
+        self._seen_hashes.update(new_chunks)
         return True
 
     def query(
@@ -0,0 +1,25 @@
+# Import Libraries
+from typing import List
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+
+
+class StableOrderRetriever(BaseRetriever):
+    """
+    Retriever that returns another retriever's documents in document order.
+
+    Retrieved fragments are otherwise ordered by relevance, which changes from
+    query to query; a stable order keeps the prompt prefix identical whenever
+    the same fragments come back, so provider-side prompt caching can reuse it.
+    """
+
+    retriever: BaseRetriever
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        documents = self.retriever.invoke(
+            query, config={"callbacks": run_manager.get_child()}
+        )
+        return sorted(documents, key=lambda document: document.metadata["chunk"])
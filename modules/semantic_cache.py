@@ -0,0 +1,147 @@
+# Import Libraries
+import hashlib
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class SemanticCache:
+    """
+    A cache of RAG responses looked up by cosine similarity of query embeddings.
+
+    An exact-match layer keyed on the query text and recent conversation sits in
+    front of the similarity search, so repeated questions skip the embedding call.
+    The exact layer is partitioned by the recent conversation, since a follow-up
+    question's answer depends on what came before it; the similarity layer only
+    holds standalone questions, asked with no conversation before them.
+    """
+
+    def __init__(
+        self,
+        embed_query: Callable[[str], List[float]],
+        threshold: float = 0.95,
+        max_entries: int = 512,
+        max_exact_entries: int = 256,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            embed_query: Function that embeds a query string
+            threshold: Minimum cosine similarity for a cached response to be reused
+            max_entries: Maximum number of cached responses; the oldest are evicted first
+            max_exact_entries: Maximum number of exact-match entries, evicted least recently used
+        """
+        self.embed_query = embed_query
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_exact_entries = max_exact_entries
+
+        self._vectors: Optional[np.ndarray] = None
+        self._responses: List[Dict[str, Any]] = []
+        self._exact: OrderedDict[Tuple[str, str], Dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def history_key(chat_history: List[Tuple[str, str]], turns: int = 3) -> str:
+        """
+        Fingerprint the most recent turns of a conversation.
+
+        Args:
+            chat_history: List of previous interactions as (human_message, ai_message) tuples
+            turns: Number of most recent turns to include
+
+        Returns:
+            A short hex digest of the recent turns
+        """
+        recent = repr(chat_history[-turns:]).encode()
+        return hashlib.blake2b(recent, digest_size=8).hexdigest()
+
+    def get_exact(self, query: str, history_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached response for the same query asked in the same conversation state.
+
+        Args:
+            query: The user's query
+            history_key: Fingerprint of the recent conversation, from history_key()
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        with self._lock:
+            response = self._exact.get((query, history_key))
+            if response is not None:
+                self._exact.move_to_end((query, history_key))
+            return response
+
+    def set_exact(
+        self, query: str, history_key: str, response: Dict[str, Any]
+    ) -> None:
+        """
+        Cache a response for an exact query and conversation state.
+
+        Args:
+            query: The user's query
+            history_key: Fingerprint of the recent conversation, from history_key()
+            response: The response from the RAG system
+        """
+        with self._lock:
+            self._exact[(query, history_key)] = response
+            self._exact.move_to_end((query, history_key))
+            while len(self._exact) > self.max_exact_entries:
+                self._exact.popitem(last=False)
+
+    def embed(self, query: str) -> np.ndarray:
+        """
+        Embed a query as a unit vector.
+
+        Args:
+            query: The user's query
+
+        Returns:
+            The normalized query embedding
+        """
+        vector = np.asarray(self.embed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, vector: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached response for the most similar previous query.
+
+        Args:
+            vector: The normalized query embedding
+
+        Returns:
+            The cached response, or None if no query is similar enough
+        """
+        with self._lock:
+            if self._vectors is None:
+                return None
+
+            # Brute-force cosine similarity is cheap at this cache size
+            scores = self._vectors @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return self._responses[best]
+
+    def set(self, vector: np.ndarray, response: Dict[str, Any]) -> None:
+        """
+        Cache a response.
+
+        Args:
+            vector: The normalized query embedding
+            response: The response from the RAG system
+        """
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = vector[np.newaxis, :]
+            else:
+                self._vectors = np.vstack([self._vectors, vector])
+            self._responses.append(response)
+
+            if len(self._responses) > self.max_entries:
+                self._vectors = self._vectors[-self.max_entries :]
+                self._responses = self._responses[-self.max_entries :]
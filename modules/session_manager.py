@@ -18,6 +18,9 @@ class SessionManager:
         if "chat_history" not in st.session_state:
             st.session_state.chat_history = []
 
+        if "rag_history" not in st.session_state:
+            st.session_state.rag_history = []
+
         if "ocr_results" not in st.session_state:
             st.session_state.ocr_results = None
 
@@ -47,7 +50,13 @@ class SessionManager:
             role: The role of the message sender ('user' or 'assistant')
             content: The content of the message
         """
-        st.session_state.chat_history.append(
+        # Pair an answer with its question as it arrives, so the RAG history
+        # never has to be rebuilt from the full chat history
+        chat_history = st.session_state.chat_history
+        if role == "assistant" and chat_history and chat_history[-1]["role"] == "user":
+            st.session_state.rag_history.append((chat_history[-1]["content"], content))
+
+        chat_history.append(
             {
                 "role": role,
                 "content": content,
@@ -74,18 +83,7 @@ class SessionManager:
         Returns:
             The chat history as a list of tuples (human_message, ai_message)
         """
-        history = []
-        messages = st.session_state.chat_history
-
-        for i in range(0, len(messages) - 1, 2):
-            if i + 1 < len(messages):
-                if (
-                    messages[i]["role"] == "user"
-                    and messages[i + 1]["role"] == "assistant"
-                ):
-                    history.append((messages[i]["content"], messages[i + 1]["content"]))
-
-        return history
+        return st.session_state.rag_history
 
     @staticmethod
     def clear_chat_history() -> None:
@@ -93,6 +91,7 @@ class SessionManager:
         Clear the chat history.
         """
         st.session_state.chat_history = []
+        st.session_state.rag_history = []
 
     @staticmethod
     def store_ocr_results(results: str) -> None:
@@ -167,6 +166,16 @@ class SessionManager:
         if "user_settings" in st.session_state:
             st.session_state.user_settings[setting_name] = value
 
+    @staticmethod
+    def get_user_settings() -> Dict[str, Any]:
+        """
+        Get all user settings.
+
+        Returns:
+            The user settings dictionary
+        """
+        return st.session_state.get("user_settings", {})
+
     @staticmethod
     def get_user_setting(setting_name: str, default: Any = None) -> Any:
         """
@@ -0,0 +1,94 @@
+import sqlite3
+
+from modules.ocr_cache import OCRCache
+
+
+def _stored_keys(cache: OCRCache) -> set:
+    """The keys currently stored on disk."""
+    return {key for (key,) in cache._conn.execute("SELECT hash FROM ocr_cache")}
+
+
+def test_round_trip_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    OCRCache(path).set("a", "text of a")
+
+    cache = OCRCache(path)
+    assert cache.get("a") == "text of a"
+    assert cache.get("missing") is None
+
+
+def test_total_size_tracks_inserts_and_replacements(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = OCRCache(path)
+    cache.set("a", "x" * 10)
+    cache.set("b", "é" * 5)
+    assert cache._total_size == 20
+
+    cache.set("a", "x" * 4)
+    assert cache._total_size == 14
+    assert OCRCache(path)._total_size == 14
+
+
+def test_evicts_least_recently_used_until_under_limit(tmp_path):
+    cache = OCRCache(tmp_path / "cache.sqlite", memory_size=0, size_limit=30)
+    cache.set("a", "x" * 10)
+    cache.set("b", "x" * 10)
+    cache.set("c", "x" * 10)
+    assert cache.get("a") == "x" * 10
+
+    cache.set("d", "x" * 10)
+    assert _stored_keys(cache) == {"a", "c", "d"}
+    assert cache._total_size == 30
+
+
+def test_memory_hits_count_as_recent_use(tmp_path):
+    cache = OCRCache(tmp_path / "cache.sqlite", size_limit=30)
+    cache.set("a", "x" * 10)
+    cache.set("b", "x" * 10)
+    cache.set("c", "x" * 10)
+
+    # Served from the in-memory layer, without reading the database
+    assert cache.get("a") == "x" * 10
+
+    cache.set("d", "x" * 10)
+    assert _stored_keys(cache) == {"a", "c", "d"}
+
+
+def test_oversized_entry_is_not_kept_on_disk(tmp_path):
+    cache = OCRCache(tmp_path / "cache.sqlite", memory_size=0, size_limit=5)
+    cache.set("a", "x" * 10)
+    assert _stored_keys(cache) == set()
+    assert cache._total_size == 0
+
+
+def test_falls_back_to_memory_when_database_cannot_open(tmp_path):
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+
+    cache = OCRCache(blocker / "cache.sqlite")
+    assert cache._conn is None
+    cache.set("a", "text of a")
+    assert cache.get("a") == "text of a"
+
+
+def test_corrupt_database_falls_back_to_memory(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    path.write_bytes(b"not a sqlite database" * 100)
+
+    cache = OCRCache(path)
+    assert cache._conn is None
+    assert cache.get("a") is None
+
+
+def test_schema_has_covering_indexes(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    OCRCache(path)
+
+    with sqlite3.connect(path) as conn:
+        indexes = {
+            name
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+    assert {"ocr_cache_lru", "ocr_cache_size"} <= indexes